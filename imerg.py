@@ -16,38 +16,22 @@ import os
 
 
 def find_closest_index(array, target):
-    closest_index = None
-    min_distance = float('inf')
-    
-    for i, num in enumerate(array):
-        distance = abs(num - target)
-        if distance < min_distance:
-            min_distance = distance
-            closest_index = i
-            
-    return closest_index
+    # Busqueda vectorizada del vecino mas cercano (una sola pasada en numpy)
+    distance = np.abs(np.asarray(array) - target)
+    return int(np.argmin(distance))
 
 
 def generate_month_year_range(initial_date, final_date):
-    result = []
-    current_date = initial_date
-    
-    while current_date <= final_date:
-        result.append(current_date.strftime("%m-%Y"))
-        current_date += timedelta(days=32)
-        current_date = current_date.replace(day=1)  # Move to the first day of the next month
-    
-    return result
+    # Primer dia de cada mes entre ambas fechas, formateado en bloque con pandas
+    if initial_date > final_date:
+        return []
+    months = pd.date_range(initial_date.replace(day=1), final_date, freq='MS')
+    return months.strftime("%m-%Y").tolist()
 
 def generate_day_of_year_range(initial_date, final_date):
-    result = []
-    current_date = initial_date
-    
-    while current_date <= final_date:
-        result.append(current_date.strftime("%j-%Y"))
-        current_date += timedelta(days=1)
-    
-    return result
+    # Rango diario formateado en bloque con pandas en vez de un bucle por dia
+    days = pd.date_range(initial_date, final_date, freq='D')
+    return days.strftime("%j-%Y").tolist()
 
 
 
@@ -102,9 +86,10 @@ def imerg(ini_date, fin_date, lat, lon):
     
 
     month_year_range = generate_month_year_range(ini_date, fin_date)
-    print(month_year_range)
     days_array = [str(day).zfill(2) for day in range(1,32)]
     array_df = []    
+    closest_index_lat = None
+    closest_index_lon = None
     for i, month_year in enumerate(month_year_range):
         [month,year] = month_year.split('-')
 
@@ -128,29 +113,23 @@ def imerg(ini_date, fin_date, lat, lon):
                 # Realizar la solicitud GET con autenticación básica
                 #result = requests.get(url, headers=headers)
                 request.urlretrieve(url,filename)
-                
-                try:
-                    request.raise_for_status()
-                    f = open(filename,'wb')
-                    f.write(request.content)
-                    f.close()
-                    #print('contents of URL written to '+filename)
-                except:
-                    print('requests.get() returned an error code '+str(request))
-
 
                 imerg_nc = Dataset(filename)
                 os.remove(filename)
                 #imerg_time = pd.to_datetime(datetime(1970, 1, 1,0,0,0) + timedelta(days=int(days)) for days in imerg_nc['time'][:])
 
-                imerg_time = pd.to_datetime(datetime(1970, 1, 1,0,0,0) + timedelta(days=int(imerg_nc['time'][:][0])))
+                imerg_time = pd.to_datetime(datetime(1970, 1, 1,0,0,0) + timedelta(days=int(imerg_nc['time'][0])))
 
-                closest_index_lat = find_closest_index(imerg_nc['lat'][:], lat)
-                closest_index_lon = find_closest_index(imerg_nc['lon'][:], lon)
+                # La grilla IMERG es la misma todos los dias: los indices se calculan una sola vez
+                if closest_index_lat is None:
+                    closest_index_lat = find_closest_index(imerg_nc['lat'][:], lat)
+                    closest_index_lon = find_closest_index(imerg_nc['lon'][:], lon)
 
                 #df = pd.DataFrame([imerg_time,np.squeeze(np.array(imerg_nc['HQprecipitation'][:][0,closest_index_lon,closest_index_lat]))], 
                 #         index = ['date','pp']).transpose().set_index('date')
-                array_df.append([imerg_time,np.squeeze(np.array(imerg_nc['HQprecipitation'][:][0,closest_index_lon,closest_index_lat]))])
+                # Se lee solo el pixel pedido, no la grilla global completa
+                array_df.append([imerg_time,np.squeeze(np.array(imerg_nc['HQprecipitation'][0,closest_index_lon,closest_index_lat]))])
+                imerg_nc.close()
                 #array_df.append(df)
             except Exception as e:
                 print(e)
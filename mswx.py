@@ -4,18 +4,14 @@ import numpy as np
 from datetime import datetime, timedelta
 import shutil
 import os
+from concurrent.futures import ThreadPoolExecutor
 from rclone_python import rclone
 
 
 def generate_day_of_year_range(initial_date, final_date):
-    result = []
-    current_date = initial_date
-    
-    while current_date <= final_date:
-        result.append(current_date.strftime("%j-%Y"))
-        current_date += timedelta(days=1)
-    
-    return result
+    # Rango diario formateado en bloque con pandas en vez de un bucle por dia
+    days = pd.date_range(initial_date, final_date, freq='D')
+    return days.strftime("%j-%Y").tolist()
 
 
 var_mswx = {'SWd':'downward_shortwave_radiation',
@@ -24,25 +20,41 @@ var_mswx = {'SWd':'downward_shortwave_radiation',
             'Tmin':'air_temperature',
             'Wind':'wind_speed'}
 
-def mswx(ini_date, fin_date):
+def download_mswx_files(var, file_names, folder_name):
+    # Una sola llamada a rclone por variable: los dias pedidos se filtran con --include
+    source = f'GoogleDrive:/MSWX_V100/NRT/{var}/Daily'
+    args = ['--drive-shared-with-me']
+    for file_name in file_names:
+        args += ['--include', file_name]
+    try:
+        rclone.copy(source, folder_name, ignore_existing=True, show_progress=False, args=args)
+    except:
+        rclone.copy(source, folder_name, ignore_existing=True, show_progress=False, args=args)
+
+
+def mswx(ini_date, fin_date, max_workers=8):
     
+    # Se limpia la carpeta de cada variable una sola vez, antes de descargar
+    for var in var_mswx.keys():
+        folder_name = f'MSWX/{var}'
+        if os.path.exists(folder_name):
+            shutil.rmtree(folder_name)
+        os.mkdir(folder_name)
+
     doy_year_range = generate_day_of_year_range(ini_date, fin_date)  
+    file_names = []
     for doy_year in doy_year_range:
         [doy, year] = doy_year.split('-')
         doy = doy.zfill(3)
+        file_names.append(f'{year}{doy}.nc')
 
-        for var in var_mswx.keys():
-            folder_name = f'MSWX/{var}'
-            if os.path.exists(folder_name):
-                shutil.rmtree(folder_name)
-            os.mkdir(folder_name)
-    
-            try:
-                rclone.copy(f'GoogleDrive:/MSWX_V100/NRT/{var}/Daily/{year}{doy}.nc', folder_name, ignore_existing=True, args=['--drive-shared-with-me'])
-            except:
-                rclone.copy(f'GoogleDrive:/MSWX_V100/NRT/{var}/Daily/{year}{doy}.nc', folder_name, ignore_existing=True, args=['--drive-shared-with-me'])
-
+    # Sin --include rclone copiaria la carpeta Daily completa
+    if not file_names:
+        return True
 
+    # Las descargas son de red/disco, cada variable se descarga en paralelo con hilos
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(lambda var: download_mswx_files(var, file_names, f'MSWX/{var}'), var_mswx.keys()))
 
     return True
 
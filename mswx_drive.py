@@ -3,6 +3,7 @@ from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseDownload
 from datetime import datetime, timedelta
+import pandas as pd
 
 class GoogleDriveManager:
     def __init__(self, credentials_file):
@@ -38,23 +39,30 @@ class GoogleDriveManager:
             
             daily_files = self.drive.files().list(
                 q=f"'{daily_folder_id}' in parents and trashed=false",
+                fields="files(id, name, size)",
                 supportsAllDrives=True, includeItemsFromAllDrives=True).execute().get('files', [])
             
             base_download_dir = os.path.join(os.getcwd(), 'MSWX')
             if not os.path.exists(base_download_dir):
                 os.makedirs(base_download_dir)
             
-            date_range = [(ini_date + timedelta(days=i)).strftime('%Y%j') for i in range((fin_date - ini_date).days + 1)]
+            # Fechas YYYYDDD generadas en bloque; el set hace la busqueda por archivo O(1)
+            date_range = set(pd.date_range(ini_date, fin_date, freq='D').strftime('%Y%j'))
+            
+            # La carpeta destino es la misma para todos los archivos de la variable
+            variable_download_dir = os.path.join(base_download_dir, folder_title)
+            os.makedirs(variable_download_dir, exist_ok=True)
+            
+            # Un solo listado de la carpeta local; se omiten los archivos ya descargados completos
+            existing = {entry.name: entry.stat().st_size for entry in os.scandir(variable_download_dir) if entry.is_file()}
             
             for file in daily_files:
-                file_date_str = file['name'][:7]
-                if file_date_str in date_range and file['name'].endswith('.nc'):
-                    variable_name = file['name'].split('_')[0]
-                    variable_download_dir = os.path.join(base_download_dir, folder_title)
-                    if not os.path.exists(variable_download_dir):
-                        os.makedirs(variable_download_dir)
-                    
-                    self.download_file(file['id'], file['name'], variable_download_dir)
+                file_name = file['name']
+                if file_name[:7] in date_range and file_name.endswith('.nc'):
+                    if file_name in existing and str(existing[file_name]) == file.get('size'):
+                        print(f"Ya existe: {file_name}")
+                        continue
+                    self.download_file(file['id'], file_name, variable_download_dir)
         else:
             print(f"No se encontró la carpeta 'Daily' dentro de la carpeta con ID: {folder_id}")
 